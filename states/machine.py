@@ -1,5 +1,6 @@
 import contextlib
 import json
+import sys
 from collections import defaultdict
 from itertools import product
 from operator import attrgetter, itemgetter
@@ -141,7 +142,7 @@ class ChildState(BaseState):
         self.parent = parent
         self.path = parent.path + self.name
         self.root = parent.root
-        self.up = [self] + parent.up
+        self.up = (self,) + parent.up  # ancestors, innermost first
 
 
 class NestedState(ParentState, ChildState):
@@ -222,17 +223,25 @@ class StateMachine(ParentState):
     def __init__(self, name=None, states=None, on_stay=(), prepare=(), contextmanager=(), info=""):
         self.path = Path()
         self.root = self
-        self.up = [self]
+        self.up = (self,)
         super().__init__(name=name, states=states or {}, on_stay=on_stay,
                          prepare=prepare, contextmanager=contextmanager, info=info)
         self._init_transitions()
         self._callback_cache = defaultdict(dict)  # cache for transition lookup when trigger is called
+        self._state_name_cache = {}  # cache for full (default) state names when the state is set directly
+        self._context_manager = _marker  # cache for _get_contextmanager()
         self.use_attr = False
         self.owner_cls = None
         self.validated = False
 
+    @lazy_property
+    def states_by_name(self):
+        """ flat lookup of all sub-states by full dotted name; the state tree does not change after construction """
+        return {str(state.path): state for state in self.iter_states() if state is not self}
+
     def _reset_on_new_callback(self):
         self._callback_cache.clear()
+        self._context_manager = _marker
         if self.owner_cls:
             self.install_triggers(self.owner_cls)
 
@@ -260,20 +269,31 @@ class StateMachine(ParentState):
         if (self.use_attr and getattr(obj, self.name, None)) or self.name in obj.__dict__:
             raise TransitionError(f"state of {type(obj).__name__} cannot be changed directly; use triggers instead")
 
-        path = Path(state_name)
+        full_state_name = self.get_full_state_name(state_name)
+        if self.use_attr:
+            setattr(obj, self.name, full_state_name)
+        else:
+            obj.__dict__[self.name] = full_state_name
+
+    def get_full_state_name(self, state_name):
+        """ returns the name of the (default) leaf state for state_name; cached, the state tree does not change """
+        if not isinstance(state_name, str):  # e.g. a list of state names, which is not hashable
+            state_name = str(Path(state_name))
         try:
-            target = path.get_in(self)
+            return self._state_name_cache[state_name]
         except KeyError:
-            raise TransitionError(f"state machine does not have a state '{state_name}'")
-        else:
-            full_state_name = str(path + target.default_path)
-            if self.use_attr:
-                setattr(obj, self.name, full_state_name)
-            else:
-                obj.__dict__[self.name] = full_state_name
+            path = Path(state_name)
+            try:
+                target = path.get_in(self)
+            except KeyError:
+                raise TransitionError(f"state machine does not have a state '{state_name}'")
+            full_state_name = self._state_name_cache[state_name] = sys.intern(str(path + target.default_path))
+            return full_state_name
 
     def set_state_callback(self, state_name):
+        """ state names are interned, so the trigger cache lookups on state name can compare by identity """
         name = self.name
+        state_name = sys.intern(state_name)
         if self.use_attr:
             def inner_set_state_callback(obj, *_, **__):  # mimic other callbacks
                 setattr(obj, name, state_name)
@@ -303,7 +323,7 @@ class StateMachine(ParentState):
             if len(funcs) == 1:
                 trigger_function = funcs[0]
             else:
-                def trigger_function(obj, *args, __fs=funcs, **kwargs):
+                def trigger_function(obj, *args, __fs=tuple(funcs), **kwargs):
                     for f in __fs:  # one function per state machine
                         f(obj, *args, **kwargs)
                     return obj
@@ -432,11 +452,19 @@ class StateMachine(ParentState):
             ctx_manager = contextlib.contextmanager(gen)
             ctx_manager.__keyword__ = keyword
             self.callbacks.register(contextmanager=ctx_manager)
+            self._reset_on_new_callback()  # the triggers were reinstalled before this manager existed
+            return gen
 
         self._reset_on_new_callback()
         return register
 
     def _get_contextmanager(self):
+        """ cached, because init_entry() asks for it on every call of trigger_initial() """
+        if self._context_manager is _marker:
+            self._context_manager = self._create_contextmanager()
+        return self._context_manager
+
+    def _create_contextmanager(self):
         ctx_mgrs = self.callbacks['contextmanager']
         if not ctx_mgrs:
             return None
@@ -445,17 +473,29 @@ class StateMachine(ParentState):
             context_manager = ctx_mgrs[0]
             keyword = context_manager.__keyword__
 
-            def create_context(obj, *args, **kwargs):
-                with context_manager(obj, *args, **kwargs) as context:
-                    yield {keyword: context} if keyword else None
-        else:
-            keywords = [c.__keyword__ for c in ctx_mgrs]
+            class SingleContext(object):
+                """ plain class instead of another generator based context manager; this runs on every transition """
+                __slots__ = ('manager',)
+
+                def __init__(self, obj, *args, **kwargs):
+                    self.manager = context_manager(obj, *args, **kwargs)
+
+                def __enter__(self):
+                    context = self.manager.__enter__()
+                    return {keyword: context} if keyword else {}
+
+                def __exit__(self, *exc_info):
+                    return self.manager.__exit__(*exc_info)
 
-            def create_context(obj, *args, **kwargs):
-                with contextlib.ExitStack() as stack:
-                    enter = stack.enter_context
-                    contexts = [enter(cm(obj, *args, **kwargs)) for cm in ctx_mgrs]
-                    yield {kw: ctx for kw, ctx in zip(keywords, contexts) if kw}
+            return SingleContext
+
+        keywords = [c.__keyword__ for c in ctx_mgrs]
+
+        def create_context(obj, *args, **kwargs):
+            with contextlib.ExitStack() as stack:
+                enter = stack.enter_context
+                contexts = [enter(cm(obj, *args, **kwargs)) for cm in ctx_mgrs]
+                yield {kw: ctx for kw, ctx in zip(keywords, contexts) if kw}
 
         return contextlib.contextmanager(create_context)
 
@@ -485,27 +525,32 @@ class StateMachine(ParentState):
         use_attr = self.use_attr
 
         def get_callbacks(state_name):
-            transactions = Path(state_name).get_in(self).trigger_transitions[trigger]
+            transactions = self.states_by_name[state_name].trigger_transitions.get(trigger)
             if transactions:
-                return [(t.conditions or None, t.effective_callbacks) for t in transactions]  # resolve falsehood
-            raise TransitionError(f"no transition from '{state_name}' with trigger '{trigger}' in machine '{self.name}'")
+                return tuple((t.condition, t.effective_callbacks) for t in transactions)
+            message = f"no transition from '{state_name}' with trigger '{trigger}' in machine '{self.name}'"
+
+            def no_transition(obj, *args, **kwargs):  # cached as condition, so repeated misses skip the lookup
+                raise TransitionError(message)
+
+            return ((no_transition, ()),)
 
         def execute(obj, *args, **kwargs):
             if use_attr:
                 state_name = getattr(obj, attr_name)
             else:
-                state_name = obj.__dict__[attr_name]
+                state_name = obj.__dict__[attr_name]  # bypasses the state machine descriptor
             try:
                 condition_callbacks = callback_cache[state_name]
             except KeyError:
                 condition_callbacks = callback_cache[state_name] = get_callbacks(state_name)
 
-            for conditions, callbacks in condition_callbacks:
-                if conditions is None or all(c(obj, *args, **kwargs) for c in conditions):
+            for condition, callbacks in condition_callbacks:
+                if condition is None or condition(obj, *args, **kwargs):
                     for callback in callbacks:
                         callback(obj, *args, **kwargs)
                     return obj
-            raise MachineError(f"no transition returned 'True' from '{obj.state}' with trigger '{trigger}'; please report!")
+            raise MachineError(f"no transition returned 'True' from '{state_name}' with trigger '{trigger}'; please report!")
 
         def get_trigger_func(execute_, prepare_, contextmanager_):
             if contextmanager_:
@@ -206,6 +206,9 @@ def normalize_statemachine_config(**root_config):
                     return new_transition
 
                 for transition in state_config.pop('transitions', ()):
+                    for key in ('old_state', 'new_state', 'trigger'):
+                        if key in transition and transition[key] is None:  # listify() would turn None into []
+                            raise MachineError(f"transition argument '{key}' cannot be None in {transition}")
                     transition = listify_by_keys(transition,
                                                  *trans_listify_keys)
                     old_states = transition.pop('old_state')
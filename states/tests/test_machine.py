@@ -313,6 +313,26 @@ class TestStateMachine(unittest.TestCase):
         with self.assertRaises(TransitionError):
             block.cool()
         self.assertEqual(block.state, "solid")
+        self.assertEqual(set(self.machine['solid'].trigger_transitions), {'melt', 'heat'})
+
+    def test_repeated_transition_error(self):
+        """tests whether a cached unavailable trigger keeps raising and does not block triggers after a new callback"""
+        block = self.object_class("block")
+        messages = []
+        for _ in range(2):
+            with self.assertRaises(TransitionError) as context:
+                block.evaporate()
+            messages.append(str(context.exception))
+        self.assertEqual(messages[0], messages[1])
+        self.assertEqual(block.state, "solid")
+
+        entered = []
+        self.object_class.state.on_entry('liquid')(lambda obj, **kwargs: entered.append(obj.state))
+        with self.assertRaises(TransitionError):
+            block.evaporate()
+        block.melt()
+        self.assertEqual(block.state, "liquid")
+        self.assertEqual(entered, ["liquid"])
 
     def test_init_error(self):
         """tests whether a non-existing initial state is detected"""
@@ -368,6 +388,14 @@ class TestStateMachine(unittest.TestCase):
         with self.assertRaises(TransitionError):
             b.state = "liquid"
 
+    def test_none_in_transition(self):
+        """tests whether None as old_state, new_state or trigger in a raw transition dict is detected"""
+        for trans_dict in (dict(old_state=None, new_state='b', trigger='x'),
+                           dict(old_state='a', new_state=None, trigger='x'),
+                           dict(old_state='a', new_state='b', trigger=None)):
+            with self.assertRaises(MachineError):
+                state_machine(states=states('a', 'b'), transitions=[trans_dict])
+
     def test_double_transition(self):
         with self.assertRaises(MachineError):
             state_machine(
@@ -882,6 +910,17 @@ class TestNestedStateMachine(unittest.TestCase):
         self.assertEqual(washer.state, "on.drying")
         self.assert_counters(washer, 5, 5, 3, 2)
 
+    def test_initial_state_not_a_string(self):
+        class Washer(StatefulObject):
+            state = state_machine(states=states(off=state(states('working', 'broken')),
+                                                on=state(states('waiting', 'drying'))))
+
+        self.assertEqual(Washer(state=['on', 'drying']).state, "on.drying")
+        self.assertEqual(Washer(state=('off', 'broken')).state, "off.broken")
+        self.assertEqual(Washer(state=Path('on')).state, "on.waiting")
+        with self.assertRaises(TransitionError):
+            Washer(state=['on', 'broken'])
+
     def test_state_string(self):
         assert str(self.object_class.state["on"]) == "State('on')"
         assert str(self.object_class.state["on"]["washing"]) == "State('on.washing')"
@@ -1230,6 +1269,61 @@ class TestContextManager(unittest.TestCase):
         assert radio.ctx1 is False
         assert radio.ctx2 is False
 
+    def test_single_manager_without_keyword(self):
+        class Radio(StatefulObject):
+            state = state_machine(
+                states=states('off', 'on'),
+                transitions=[
+                    transition("off", "on", trigger="flick"),
+                    transition("on", "off", trigger="flick"),
+                ],
+            )
+
+            def __init__(self):
+                super().__init__()
+                self.managed = []
+
+            @state.on_entry('on', 'off')
+            def on_action(self):
+                self.managed.append(self.state)
+
+            @state.contextmanager()
+            def object_manager(self):
+                self.managed.append('enter')
+                yield
+                self.managed.append('exit')
+
+        radio = Radio()
+        radio.managed.clear()
+        radio.flick()
+        assert radio.managed == ['enter', 'on', 'exit']
+
+    def test_manager_added_after_class_creation(self):
+        class Radio(StatefulObject):
+            state = state_machine(
+                states=states('off', 'on'),
+                transitions=[
+                    transition("off", "on", trigger="flick"),
+                    transition("on", "off", trigger="flick"),
+                ],
+            )
+
+        managed = []
+
+        @Radio.state.on_entry('on', 'off')
+        def on_action(obj, context):
+            managed.append(context)
+
+        @Radio.state.contextmanager('context')
+        def object_manager(obj):
+            managed.append('enter')
+            yield 'ctx'
+            managed.append('exit')
+
+        radio = Radio()
+        radio.flick()
+        assert managed == ['enter', 'ctx', 'exit']
+
 
 class TestCallbackArguments(unittest.TestCase):
 
@@ -1740,6 +1834,13 @@ class TestStateConstraint(unittest.TestCase):
         user.login(password='very_secret')
         assert user.state == 'active.logged_in'
 
+    def test_constraint_called_once(self):
+        transition = self.user_class.state['active']['logged_out'].trigger_transitions['login'][0]
+        for _ in range(3):
+            transition.conditions  # used to add the constraints to the conditions on every call
+        assert len(transition.conditions) == 1
+        assert len(transition.callbacks['condition']) == 0
+
 
 class TestStateConstraint2(unittest.TestCase):
 
@@ -1,7 +1,7 @@
 import unittest
 
 from states.configuration import default_case
-from states.tools import Path, copy_struct
+from states.tools import Path, copy_struct, listify
 from states import state, transition, case
 
 __author__ = "lars van gemerden"
@@ -79,6 +79,19 @@ class TestPath(unittest.TestCase):
     def test_add(self):
         assert Path('a') + 'b' + Path('c') == Path('a.b.c')
 
+    def test_cached_string_paths(self):
+        path = Path('a.1.b')
+        assert path is Path('a.1.b')
+        assert path == Path(['a', 1, 'b'])
+        assert hash(path) == hash(Path(['a', 1, 'b']))
+        assert {path: 1}[Path(['a', 1, 'b'])] == 1
+
+        sliced, added = path[:-1], path + 'c'
+        assert type(sliced) is Path and type(added) is Path
+        assert sliced == Path('a.1') and added == Path('a.1.b.c')
+        assert path[:] is not path
+        assert path == ('a', 1, 'b') and Path('a.1.b') is path
+
     def test_splice(self):
         x = 'a.b.c'
         y = 'a.b.d.e'
@@ -168,6 +181,16 @@ class TestDictClasses(unittest.TestCase):
 
 class TestFunctions(unittest.TestCase):
 
+    def test_listify(self):
+        def f():
+            pass
+
+        assert listify(None) == []
+        assert listify('abc') == ['abc']
+        assert listify(f) == [f]
+        assert listify((1, 2)) == [1, 2]
+        assert listify([1, 2]) == [1, 2]
+
     def test_copy_struct(self):
         struct = {'a': [1, 2, 3],
                   'b': (4, 5),
@@ -181,3 +204,11 @@ class TestFunctions(unittest.TestCase):
 
         def f():
             pass
+
+        class C(object):
+            pass
+
+        struct = {'f': [f], 'c': C}
+        copy = copy_struct(struct)
+        assert copy['f'][0] is f
+        assert copy['c'] is C
@@ -2,6 +2,7 @@ __author__ = "lars van gemerden"
 
 from collections import defaultdict
 from contextlib import contextmanager
+from functools import lru_cache
 from itertools import zip_longest
 from random import random
 from time import perf_counter
@@ -10,9 +11,9 @@ from typing import Sequence, Mapping, MutableMapping, Set
 
 def copy_struct(value_or_mapping_or_sequence):
     vms = value_or_mapping_or_sequence
+    if isinstance(vms, str) or callable(vms):
+        return vms  # callbacks (and classes) are shared, not copied
     try:
-        if isinstance(vms, str):
-            return vms
         if isinstance(vms, (Set, Sequence)):
             return type(vms)(copy_struct(v) for v in vms)
         elif isinstance(vms, Mapping):
@@ -24,11 +25,12 @@ def copy_struct(value_or_mapping_or_sequence):
 
 
 def listify(list_or_item):
-    """utitity function to ensure an argument becomes a list if it is not one yet"""
+    """utitity function to ensure an argument becomes a list if it is not one yet; None becomes an empty list"""
+    if list_or_item is None:
+        return []
     if isinstance(list_or_item, (list, tuple, set)):
         return list(list_or_item)
-    else:
-        return [list_or_item]
+    return [list_or_item]
 
 
 def class_attributes(cls, filter=lambda a: True):
@@ -57,6 +59,8 @@ class Path(tuple):
     example: Path("some.3.thing") == Path(["some", 3, "thing"])
     '''
 
+    __slots__ = ()  # no per-instance __dict__; paths are created a lot and are immutable anyway
+
     separator = "."
 
     @classmethod
@@ -113,11 +117,20 @@ class Path(tuple):
         except ValueError:
             return v
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _from_string(cls, string):
+        """
+        creates a path from a '.' separated string; cached, because the same state names are parsed over and over
+        and paths are immutable, so the same instance can be returned for the same string
+        """
+        validate = cls.validate
+        return super().__new__(cls, (validate(s) for s in string.split(cls.separator) if len(s)))
+
     def __new__(cls, string_s=()):
         """constructor for path; __new__ is used because objects of base class tuple are immutable"""
         if isinstance(string_s, str):
-            validate = cls.validate
-            string_s = (validate(s) for s in string_s.split(cls.separator) if len(s))
+            return cls._from_string(string_s)
         return super().__new__(cls, string_s)
 
     def __getitem__(self, key):
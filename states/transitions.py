@@ -1,7 +1,7 @@
 __author__ = "lars van gemerden"
 
 import json
-from itertools import zip_longest
+from itertools import zip_longest, takewhile
 
 from .callbacks import Callbacks
 from .tools import Path, lazy_property
@@ -17,6 +17,7 @@ class Transition(object):
         self.states = [state] + list(states)
         self.trigger = trigger
         self.info = info
+        self._state_chains = {}  # cache for exit_entry_states()
 
     @lazy_property
     def is_same_state(self):
@@ -33,11 +34,26 @@ class Transition(object):
 
     @property
     def conditions(self):
-        conditions = self.callbacks['condition']
-        for target in self.states[1:]:
-            for state in target.up:
-                conditions.extend(state.callbacks['constraint'])
-        return [c for c in conditions if c]
+        """ tuple of the conditions on the transition and the constraints on the target states """
+        constraints = [c for target in self.states[1:] for state in target.up for c in state.callbacks['constraint']]
+        return tuple(c for c in self.callbacks['condition'] + constraints if c)
+
+    @property
+    def condition(self):
+        """ single callable checking all conditions and constraints, None if there are none """
+        conditions = self.conditions
+        if not conditions:
+            return None
+        if len(conditions) == 1:
+            return conditions[0]
+
+        def condition(obj, *args, **kwargs):
+            for c in conditions:
+                if not c(obj, *args, **kwargs):
+                    return False
+            return True
+
+        return condition
 
     @property
     def on_transfers(self):
@@ -46,44 +62,45 @@ class Transition(object):
     def before_exits(self, state):
         if self.is_same_state:
             return []
-        all_exits = sum((s.parent.callbacks['before_exit'] for s in state.up if s.parent), [])
-        return list(reversed([e for e in all_exits if e]))
+        all_exits = [e for s in state.up if s.parent for e in s.parent.callbacks['before_exit'] if e]
+        return all_exits[::-1]
 
     def after_entries(self, state):
         if self.is_same_state:
             return []
-        all_entries = sum((s.parent.callbacks['after_entry'] for s in state.up if s.parent), [])
-        return [e for e in all_entries if e]
+        return [e for s in state.up if s.parent for e in s.parent.callbacks['after_entry'] if e]
+
+    def exit_entry_states(self, old_state, new_state):
+        """ returns the states exited (inner to outer) and entered (outer to inner); cached, the state tree is fixed """
+        key = old_state.path, new_state.path  # states are mappings, so not hashable
+        try:
+            return self._state_chains[key]
+        except KeyError:
+            common_state = self.common_state(old_state,
+                                             new_state)
+            exited = tuple(takewhile(lambda s: s is not common_state, old_state.up))
+            entered = tuple(takewhile(lambda s: s is not common_state, new_state.up))[::-1]
+            result = self._state_chains[key] = (exited, entered)
+            return result
 
     def on_exits(self, old_state, new_state):
-        on_exits = []
-        common_state = self.common_state(old_state,
-                                         new_state)
-        for state in old_state.up:
-            if state is common_state:
-                break
-            on_exits.extend(state.callbacks['on_exit'])
-        return [e for e in on_exits if e]
+        exited, _ = self.exit_entry_states(old_state, new_state)
+        return [e for state in exited for e in state.callbacks['on_exit'] if e]
 
     def on_entries(self, old_state, new_state):
-        on_entries = []
-        common_state = self.common_state(old_state,
-                                         new_state)
-        for state in new_state.up:
-            if state is common_state:
-                break
-            on_entries.extend(state.callbacks['on_entry'])
-        return list(reversed([e for e in on_entries if e]))
+        _, entered = self.exit_entry_states(old_state, new_state)
+        return [e for state in entered for e in reversed(state.callbacks['on_entry']) if e]
 
     @property
     def on_stays(self):
-        return sum((s.callbacks['on_stay'] for s in self.common_state().up if s.callbacks['on_stay']), [])
+        return [c for s in self.common_state().up for c in s.callbacks['on_stay']]
 
     def set_state(self, state):
         return self.root.set_state_callback(str(state.path))
 
     @property
     def effective_callbacks(self):
+        """ flat tuple of all callbacks in calling order, including the actual state change """
         callbacks = []
         for old_state, new_state in zip(self.states[:-1], self.states[1:]):
             callbacks.extend([*self.before_exits(old_state),
@@ -93,16 +110,16 @@ class Transition(object):
                               *self.after_entries(new_state)])
         callbacks.extend(self.on_transfers)
         callbacks.extend(self.on_stays)
-        return callbacks
+        return tuple(callbacks)
 
     @property
     def execute(self):
-        conditions = self.conditions
+        condition = self.condition
         callbacks = self.effective_callbacks
 
-        if conditions:
+        if condition:
             def execute(obj, *args, **kwargs):
-                if all(c(obj, *args, **kwargs) for c in conditions):
+                if condition(obj, *args, **kwargs):
                     for callback in callbacks:
                         callback(obj, *args, **kwargs)
                     return True